@@ -23,14 +23,27 @@ Expert Blueprint Reference: "Invocation to Global Deployment"
 """
 
 import asyncio
+import functools
 import json
 import logging
+import multiprocessing
+import operator
+import os
+import queue
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, FrozenSet, Set, Tuple, Callable
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+try:
+    import orjson  # Optional accelerator; the manifest falls back to stdlib json
+except ImportError:
+    orjson = None
+
 # Import all sacred deployment systems
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
@@ -45,6 +58,64 @@ from economics.market_validator import EconomicModelValidator
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - [SACRED DEPLOYMENT] - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Each spawned Monte Carlo worker re-imports this module (~150ms), so it needs at
+# least this many iterations (~12ms each at 50 steps) to pay for itself
+MONTE_CARLO_MIN_SLICE_ITERATIONS = 25
+
+@contextmanager
+def _queued_logging(target: logging.Logger):
+    """Route target's records through a background QueueListener so coroutines never block on handler I/O"""
+    handlers = logging.getLogger().handlers
+    if not handlers or not target.propagate:
+        yield
+        return
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_handler = QueueHandler(log_queue)
+    target.addHandler(queue_handler)
+    target.propagate = False
+    listener.start()
+    try:
+        yield
+    finally:
+        target.removeHandler(queue_handler)
+        target.propagate = True
+        listener.stop()  # Drains every queued record before returning
+
+def _run_monte_carlo_slice(validator: EconomicModelValidator, iterations: int,
+                           steps_per_iteration: int) -> Tuple[list, list]:
+    """Run a slice of the Monte Carlo batch on a worker's copy of the validator"""
+    # The copy carries the parent's history; only transactions made here are returned
+    history_start = len(validator.transaction_history)
+    simulation_results = validator.run_monte_carlo_simulation(
+        iterations=iterations, steps_per_iteration=steps_per_iteration
+    )
+    return simulation_results, validator.transaction_history[history_start:]
+
+def _write_deployment_manifest(manifest_path: Path, deployment_summary: Dict[str, Any]):
+    """Write the manifest beside its target and swap it in, so readers never see a half-written file"""
+    manifest_path.parent.mkdir(exist_ok=True)
+    
+    temp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    try:
+        if orjson is not None:
+            temp_path.write_bytes(orjson.dumps(
+                deployment_summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+        else:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(deployment_summary, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, manifest_path)
+    except BaseException:
+        # A failed serialization or swap must not leave the partial temp file behind
+        temp_path.unlink(missing_ok=True)
+        raise
+
+def _accept_any(actual_value: Any) -> bool:
+    """Validator for criteria that are only required to be present"""
+    return True
+
 @dataclass
 class DeploymentPhase:
     """Sacred deployment phase configuration"""
@@ -52,9 +123,26 @@ class DeploymentPhase:
     phase_name: str
     description: str
     duration_days: int
-    prerequisites: List[str]
+    prerequisites: FrozenSet[str]
     success_criteria: Dict[str, Any]
     sacred_invocation: str
+    
+    def __post_init__(self):
+        # Frozen once so prerequisite checks are a single issuperset call
+        self.prerequisites = frozenset(self.prerequisites)
+    
+    def criteria_validators(self) -> List[Tuple[str, Any, Callable[[Any], bool], bool]]:
+        """(criterion, expected, check, is_flag) per current criterion: bools must match exactly, numbers are minimums"""
+        validators = []
+        for criterion, expected_value in self.success_criteria.items():
+            if isinstance(expected_value, bool):
+                check, is_flag = functools.partial(operator.eq, expected_value), True
+            elif isinstance(expected_value, (int, float)):
+                check, is_flag = functools.partial(operator.le, expected_value), False
+            else:
+                check, is_flag = _accept_any, False
+            validators.append((criterion, expected_value, check, is_flag))
+        return validators
 
 @dataclass
 class DeploymentResult:
@@ -65,6 +153,17 @@ class DeploymentResult:
     metrics: Dict[str, Any]
     errors: List[str]
     recommendations: List[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow field dict for the manifest; metrics is already plain data, so asdict's deep copy is skipped"""
+        return {
+            'phase_name': self.phase_name,
+            'success': self.success,
+            'execution_time': self.execution_time,
+            'metrics': self.metrics,
+            'errors': self.errors,
+            'recommendations': self.recommendations
+        }
 
 class SacredDeploymentOrchestrator:
     """
@@ -97,8 +196,11 @@ class SacredDeploymentOrchestrator:
         
         # Deployment tracking
         self.deployment_phases = self._initialize_deployment_phases()
-        self.phase_results: List[DeploymentResult] = []
-        self.deployment_start_time = None
+        # One slot per phase (phase_number - 1), so results stay in phase order whatever order they finish in
+        self.phase_results: List[Optional[DeploymentResult]] = [None] * len(self.deployment_phases)
+        self._completed_phase_names: Set[str] = set()
+        self.deployment_start_time = None  # Wall clock, only for the manifest timestamp
+        self._deployment_start_ns = 0  # Monotonic, for elapsed time
         self.current_phase = 0
         
         # Sacred invocations for each phase
@@ -194,66 +296,95 @@ class SacredDeploymentOrchestrator:
         Execute the complete sacred deployment across all five phases
         Implements expert blueprint's phased rollout with sacred timing
         """
-        logger.info(" COMMENCING SACRED DEPLOYMENT TO GLOBAL ETERNITY ")
-        logger.info("Invoking the 30 Aethyrs for worldwide manifestation of sacred wisdom")
-        
-        self.deployment_start_time = time.time()
-        deployment_success = True
-        
-        # Execute each phase in sacred sequence
-        for phase in self.deployment_phases:
-            logger.info(f"\n{'='*60}")
-            logger.info(f"PHASE {phase.phase_number}: {phase.phase_name.upper()}")
-            logger.info(f"Sacred Invocation: {phase.sacred_invocation}")
-            logger.info(f"{'='*60}")
+        with _queued_logging(logger):
+            logger.info(" COMMENCING SACRED DEPLOYMENT TO GLOBAL ETERNITY ")
+            logger.info("Invoking the 30 Aethyrs for worldwide manifestation of sacred wisdom")
+
+            # Each run starts from scratch, so a repeat deployment re-gates every phase
+            self.phase_results = [None] * len(self.deployment_phases)
+            self._completed_phase_names.clear()
+            self.current_phase = 0
+
+            self.deployment_start_time = time.time()
+            self._deployment_start_ns = time.perf_counter_ns()
+            deployment_success = True
             
-            # Check prerequisites
-            if not self._check_prerequisites(phase):
-                logger.error(f"Prerequisites not met for {phase.phase_name}")
-                deployment_success = False
-                break
+            # Execute phases as a dependency graph: each phase starts as soon as its
+            # prerequisites complete, so phases off the critical path overlap
+            pending_phases = list(self.deployment_phases)
+            running_phases: Dict[asyncio.Future, DeploymentPhase] = {}
             
-            # Execute phase
-            phase_result = await self._execute_deployment_phase(phase)
-            self.phase_results.append(phase_result)
+            while pending_phases or running_phases:
+                # Launch every ready phase unless an earlier phase has already failed
+                if deployment_success:
+                    ready_phases = [phase for phase in pending_phases if self._check_prerequisites(phase)]
+                    for phase in ready_phases:
+                        pending_phases.remove(phase)
+                        logger.info(f"\n{'='*60}")
+                        logger.info(f"PHASE {phase.phase_number}: {phase.phase_name.upper()}")
+                        logger.info(f"Sacred Invocation: {phase.sacred_invocation}")
+                        logger.info(f"{'='*60}")
+                        logger.info(f"TASK_STARTED: {phase.phase_name}")
+                        running_phases[asyncio.ensure_future(self._execute_deployment_phase(phase))] = phase
+                
+                if not running_phases:
+                    # Nothing in flight and nothing launchable: remaining prerequisites can never be met
+                    if deployment_success:
+                        for phase in pending_phases:
+                            logger.error(f"Prerequisites not met for {phase.phase_name}")
+                        deployment_success = not pending_phases
+                    break
+                
+                completed, _ = await asyncio.wait(running_phases, return_when=asyncio.FIRST_COMPLETED)
+                for task in completed:
+                    phase = running_phases.pop(task)
+                    phase_result = task.result()
+                    self.phase_results[phase.phase_number - 1] = phase_result
+                    logger.info(f"TASK_COMPLETED: {phase.phase_name}")
+                    
+                    if not phase_result.success:
+                        logger.error(f"Phase {phase.phase_number} failed: {phase.phase_name}")
+                        deployment_success = False
+                        continue
+                    
+                    logger.info(f"✅ Phase {phase.phase_number} completed successfully")
+                    self._completed_phase_names.add(phase.phase_name)
+                    self.current_phase = max(self.current_phase, phase.phase_number)
             
-            if not phase_result.success:
-                logger.error(f"Phase {phase.phase_number} failed: {phase.phase_name}")
-                deployment_success = False
-                break
+            # Calculate total deployment time
+            total_deployment_time = (time.perf_counter_ns() - self._deployment_start_ns) / 1e9
             
-            logger.info(f"✅ Phase {phase.phase_number} completed successfully")
-            self.current_phase = phase.phase_number
-        
-        # Calculate total deployment time
-        total_deployment_time = time.time() - self.deployment_start_time
-        
-        # Generate deployment summary
-        deployment_summary = {
-            'deployment_success': deployment_success,
-            'total_phases_completed': len(self.phase_results),
-            'total_deployment_time': total_deployment_time,
-            'deployment_start_time': datetime.fromtimestamp(self.deployment_start_time).isoformat(),
-            'deployment_end_time': datetime.now().isoformat(),
-            'phase_results': [asdict(result) for result in self.phase_results],
-            'sacred_constants': self.sacred_constants,
-            'final_status': self._generate_final_status()
-        }
-        
-        # Export deployment manifest
-        self._export_deployment_manifest(deployment_summary)
-        
-        if deployment_success:
-            logger.info(" SACRED DEPLOYMENT COMPLETE - ETERNAL WISDOM MANIFESTED GLOBALLY ")
-            logger.info("The 91 Governor Angels now guide humanity through Bitcoin's immutable ledger")
-        else:
-            logger.error("❌ Sacred deployment encountered obstacles - Divine intervention required")
-        
-        return deployment_summary
+            # Generate deployment summary
+            completed_results = self._completed_results()
+            deployment_summary = {
+                'deployment_success': deployment_success,
+                'total_phases_completed': len(completed_results),
+                'total_deployment_time': total_deployment_time,
+                'deployment_start_time': datetime.fromtimestamp(self.deployment_start_time).isoformat(),
+                'deployment_end_time': datetime.now().isoformat(),
+                'phase_results': [result.to_dict() for result in completed_results],
+                'sacred_constants': self.sacred_constants,
+                'final_status': self._generate_final_status()
+            }
+            
+            # Export deployment manifest
+            await self._export_deployment_manifest(deployment_summary)
+            
+            if deployment_success:
+                logger.info(" SACRED DEPLOYMENT COMPLETE - ETERNAL WISDOM MANIFESTED GLOBALLY ")
+                logger.info("The 91 Governor Angels now guide humanity through Bitcoin's immutable ledger")
+            else:
+                logger.error("❌ Sacred deployment encountered obstacles - Divine intervention required")
+            
+            return deployment_summary
 
     async def _execute_deployment_phase(self, phase: DeploymentPhase) -> DeploymentResult:
-        """Execute individual deployment phase with sacred patterns"""
-        phase_start_time = time.time()
+        """
+        Execute individual deployment phase with sacred patterns
+        Phases overlap on one event loop, so each phase hands its blocking
+        system calls to run_in_executor rather than calling them inline
+        """
+        phase_start_ns = time.perf_counter_ns()
         errors = []
         recommendations = []
         metrics = {}
@@ -290,7 +421,7 @@ class SacredDeploymentOrchestrator:
             errors.append(str(e))
             success = False
             
-        execution_time = time.time() - phase_start_time
+        execution_time = (time.perf_counter_ns() - phase_start_ns) / 1e9
         
         return DeploymentResult(
             phase_name=phase.phase_name,
@@ -305,15 +436,15 @@ class SacredDeploymentOrchestrator:
         """Execute Phase 1: Live Deployment Strategy"""
         logger.info("Initializing Live API Integration with sacred patterns...")
         
-        # Initialize live API integrator
-        config = LiveAPIConfig(
-            max_concurrent_calls=10,
-            max_retries=3,
-            fallback_to_mock=True,
-            enochian_invocation_mode=True
-        )
-        
-        self.live_api_integrator = LiveAPIIntegrator(config)
+        # Initialize live API integrator once; repeat deployments reuse its retriever and rate limiter
+        if self.live_api_integrator is None:
+            config = LiveAPIConfig(
+                max_concurrent_calls=10,
+                max_retries=3,
+                fallback_to_mock=True,
+                enochian_invocation_mode=True
+            )
+            self.live_api_integrator = LiveAPIIntegrator(config)
         
         # Test live API integration
         test_governors = ["LEXARPH", "COMANAN", "TABITOM"]
@@ -321,23 +452,27 @@ class SacredDeploymentOrchestrator:
             test_governors, quests_per_governor=5
         )
         
-        # Calculate metrics
-        total_calls = sum(len(gov_results) for gov_results in results.values())
-        successful_calls = sum(1 for gov_results in results.values() 
-                             for result in gov_results if result.success)
+        # Calculate metrics in a single pass over every governor's results
+        total_calls = 0
+        successful_calls = 0
+        average_authenticity = 0.0  # Running mean, so no successes naturally yields 0.0
+        for gov_results in results.values():
+            total_calls += len(gov_results)
+            for result in gov_results:
+                if result.success:
+                    successful_calls += 1
+                    average_authenticity += (result.authenticity_score - average_authenticity) / successful_calls
         
         metrics = {
             'total_api_calls': total_calls,
             'successful_calls': successful_calls,
             'success_rate': successful_calls / total_calls if total_calls > 0 else 0,
-            'average_authenticity': sum(result.authenticity_score 
-                                      for gov_results in results.values() 
-                                      for result in gov_results if result.success) / max(successful_calls, 1),
+            'average_authenticity': average_authenticity,
             'rate_limiting_functional': True,
             'fallback_mechanisms_tested': True
         }
         
-        logger.info(f"Live API integration metrics: {metrics}")
+        logger.info("Live API integration metrics: %s", metrics)
         return metrics
 
     async def _execute_bitcoin_l1_phase(self) -> Dict[str, Any]:
@@ -365,17 +500,21 @@ class SacredDeploymentOrchestrator:
             }
         ]
         
-        # Generate hypertokens
-        hypertokens = []
-        for governor_data in test_governors:
-            hypertoken = self.bitcoin_l1_deployer.generate_hypertoken(governor_data)
-            hypertokens.append(hypertoken)
+        loop = asyncio.get_running_loop()
+        
+        # Generate hypertokens (independent per governor, so fan out)
+        hypertokens = list(await asyncio.gather(*(
+            loop.run_in_executor(None, self.bitcoin_l1_deployer.generate_hypertoken, governor_data)
+            for governor_data in test_governors
+        )))
         
         # Create TAP inscriptions
-        inscriptions = self.bitcoin_l1_deployer.batch_inscribe_hypertokens(hypertokens, test_governors)
+        inscriptions = await loop.run_in_executor(
+            None, self.bitcoin_l1_deployer.batch_inscribe_hypertokens, hypertokens, test_governors
+        )
         
         # Deploy to Trac network
-        sync_state = self.bitcoin_l1_deployer.deploy_to_trac_network(inscriptions)
+        sync_state = await loop.run_in_executor(None, self.bitcoin_l1_deployer.deploy_to_trac_network, inscriptions)
         
         metrics = {
             'hypertokens_created': len(hypertokens),
@@ -387,7 +526,7 @@ class SacredDeploymentOrchestrator:
             'byzantine_tolerance': sync_state.byzantine_tolerance
         }
         
-        logger.info(f"Bitcoin L1 integration metrics: {metrics}")
+        logger.info("Bitcoin L1 integration metrics: %s", metrics)
         return metrics
 
     async def _execute_community_beta_phase(self) -> Dict[str, Any]:
@@ -427,21 +566,22 @@ class SacredDeploymentOrchestrator:
             )
             guilds_created += 1
         
-        # Test feedback system
-        feedback_submissions = 0
-        for player_id in player_ids[:3]:
-            feedback = self.community_beta_framework.submit_feedback(
-                player_id=player_id,
-                governor_name="LEXARPH",
-                quest_id=f"test_quest_{feedback_submissions}",
-                authenticity_score=0.95,
-                gameplay_rating=4.5,
-                wisdom_accuracy=0.96,
-                tradition_authenticity=0.94,
-                improvements="Excellent mystical content",
-                insights="Authentic Enochian wisdom captured"
-            )
-            feedback_submissions += 1
+        # Test feedback system with a single bulk submission
+        feedback_batch = self.community_beta_framework.submit_feedback_batch(
+            {
+                'player_id': player_id,
+                'governor_name': "LEXARPH",
+                'quest_id': f"test_quest_{index}",
+                'authenticity_score': 0.95,
+                'gameplay_rating': 4.5,
+                'wisdom_accuracy': 0.96,
+                'tradition_authenticity': 0.94,
+                'improvements': "Excellent mystical content",
+                'insights': "Authentic Enochian wisdom captured"
+            }
+            for index, player_id in enumerate(player_ids[:3])
+        )
+        feedback_submissions = len(feedback_batch)
         
         metrics = {
             'beta_players_registered': registered_players,
@@ -452,7 +592,7 @@ class SacredDeploymentOrchestrator:
             'community_engagement_score': 0.85
         }
         
-        logger.info(f"Community beta metrics: {metrics}")
+        logger.info("Community beta metrics: %s", metrics)
         return metrics
 
     async def _execute_performance_optimization_phase(self) -> Dict[str, Any]:
@@ -472,23 +612,28 @@ class SacredDeploymentOrchestrator:
         # Test performance optimization
         test_governors = ["LEXARPH", "COMANAN", "TABITOM", "VALGARS"]
         
-        optimization_result = self.performance_optimizer.optimize_quest_generation(
-            test_governors, quests_per_governor=25
+        optimization_result = await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(
+                self.performance_optimizer.optimize_quest_generation, test_governors, quests_per_governor=25
+            )
         )
         
+        performance_metrics = optimization_result['performance_metrics']
+        throughput_per_second = performance_metrics['throughput_per_second']
+        
         metrics = {
             'target_response_time_ms': config.target_response_time_ms,
-            'achieved_response_time_ms': optimization_result['performance_metrics']['duration_ms'],
+            'achieved_response_time_ms': performance_metrics['duration_ms'],
             'sub_50ms_response_time': optimization_result['target_achieved'],
-            'throughput_per_second': optimization_result['performance_metrics']['throughput_per_second'],
-            'throughput_20k_per_second': optimization_result['performance_metrics']['throughput_per_second'] >= 20000,
+            'throughput_per_second': throughput_per_second,
+            'throughput_20k_per_second': throughput_per_second >= 20000,
             'multiprocessing_optimized': True,
             'wasm_preparation_complete': config.enable_wasm_preparation,
             'quantum_tuning_applied': config.enable_quantum_tuning,
             'vedic_cycles_applied': config.enable_vedic_cycles
         }
         
-        logger.info(f"Performance optimization metrics: {metrics}")
+        logger.info("Performance optimization metrics: %s", metrics)
         return metrics
 
     async def _execute_economic_validation_phase(self) -> Dict[str, Any]:
@@ -498,58 +643,98 @@ class SacredDeploymentOrchestrator:
         # Initialize economic validator
         self.economic_validator = EconomicModelValidator(initial_liquidity=1000000.0)
         
+        loop = asyncio.get_running_loop()
+        
         # Create market participants and assets
-        participants = self.economic_validator.create_market_participants(participant_count=500)
+        participants = await loop.run_in_executor(
+            None, functools.partial(self.economic_validator.create_market_participants, participant_count=500)
+        )
         test_governors = ["LEXARPH", "COMANAN", "TABITOM"]
-        assets = self.economic_validator.create_quest_assets(test_governors)
+        assets = await loop.run_in_executor(None, self.economic_validator.create_quest_assets, test_governors)
         
         # Run Monte Carlo simulation (reduced iterations for deployment testing)
-        simulation_results = self.economic_validator.run_monte_carlo_simulation(
-            iterations=100, steps_per_iteration=50
-        )
+        simulation_results = await self._run_monte_carlo_parallel(iterations=100, steps_per_iteration=50)
         
         # Validate economic stability
-        validation_result = self.economic_validator.validate_economic_stability(target_stability=0.95)
+        validation_result = await loop.run_in_executor(
+            None, functools.partial(self.economic_validator.validate_economic_stability, target_stability=0.95)
+        )
+        
+        validation_metrics = self.economic_validator.validation_metrics
         
         metrics = {
             'market_participants_created': len(participants),
             'quest_assets_created': len(assets),
             'monte_carlo_simulations': len(simulation_results),
-            'monte_carlo_stability': self.economic_validator.validation_metrics['stability_rate'],
-            'nash_equilibrium_achieved': self.economic_validator.validation_metrics['nash_equilibrium_achievement'] > 0.8,
-            'manipulation_resistance': self.economic_validator.validation_metrics['manipulation_resistance_score'],
+            'monte_carlo_stability': validation_metrics['stability_rate'],
+            'nash_equilibrium_achieved': validation_metrics['nash_equilibrium_achievement'] > 0.8,
+            'manipulation_resistance': validation_metrics['manipulation_resistance_score'],
             'authenticity_pricing_validated': True,
             'economic_validation_passed': validation_result['validation_passed']
         }
         
-        logger.info(f"Economic validation metrics: {metrics}")
+        logger.info("Economic validation metrics: %s", metrics)
         return metrics
 
+    async def _run_monte_carlo_parallel(self, iterations: int, steps_per_iteration: int) -> list:
+        """Split independent Monte Carlo iterations across worker processes and merge the results"""
+        validator = self.economic_validator
+        loop = asyncio.get_running_loop()
+        worker_count = min(os.cpu_count() or 1, iterations // MONTE_CARLO_MIN_SLICE_ITERATIONS)
+        
+        if worker_count < 2:
+            return await loop.run_in_executor(
+                None, functools.partial(
+                    validator.run_monte_carlo_simulation, iterations=iterations, steps_per_iteration=steps_per_iteration
+                )
+            )
+        
+        base, extra = divmod(iterations, worker_count)
+        slice_sizes = [base + (1 if index < extra else 0) for index in range(worker_count)]
+        
+        # Spawned workers seed their own RNG and never inherit the log listener thread or its locks
+        with ProcessPoolExecutor(max_workers=worker_count,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            slices = await asyncio.gather(*(
+                loop.run_in_executor(pool, _run_monte_carlo_slice, validator, size, steps_per_iteration)
+                for size in slice_sizes
+            ))
+        
+        # Renumber so identifiers stay unique across slices, then fold back into the validator
+        simulation_results = []
+        for slice_results, slice_transactions in slices:
+            simulation_results.extend(slice_results)
+            for transaction in slice_transactions:
+                transaction.transaction_id = f"tx_{len(validator.transaction_history)}"
+                validator.transaction_history.append(transaction)
+        for index, result in enumerate(simulation_results):
+            result.simulation_id = f"sim_{index:05d}"
+        
+        validator.simulation_results = simulation_results
+        validator._update_validation_metrics()
+        logger.info("Monte Carlo simulation merged from %d workers: %d results", worker_count, len(simulation_results))
+        return simulation_results
+
     def _check_prerequisites(self, phase: DeploymentPhase) -> bool:
         """Check if phase prerequisites are met"""
-        if not phase.prerequisites:
-            return True
-        
-        completed_phases = [result.phase_name for result in self.phase_results if result.success]
-        return all(prereq in completed_phases for prereq in phase.prerequisites)
+        return self._completed_phase_names.issuperset(phase.prerequisites)
 
     def _evaluate_phase_success(self, phase: DeploymentPhase, metrics: Dict[str, Any]) -> bool:
         """Evaluate if phase meets success criteria"""
-        for criterion, expected_value in phase.success_criteria.items():
-            if criterion not in metrics:
-                logger.warning(f"Missing success criterion: {criterion}")
-                return False
-            
+        # One set difference finds every missing criterion before any value is checked
+        missing_criteria = phase.success_criteria.keys() - metrics.keys()
+        if missing_criteria:
+            for criterion in phase.success_criteria:
+                if criterion in missing_criteria:
+                    logger.warning(f"Missing success criterion: {criterion}")
+            return False
+        
+        for criterion, expected_value, check, is_flag in phase.criteria_validators():
             actual_value = metrics[criterion]
-            
-            if isinstance(expected_value, bool):
-                if actual_value != expected_value:
-                    logger.warning(f"Criterion failed: {criterion} = {actual_value}, expected {expected_value}")
-                    return False
-            elif isinstance(expected_value, (int, float)):
-                if actual_value < expected_value:
-                    logger.warning(f"Criterion failed: {criterion} = {actual_value}, expected >= {expected_value}")
-                    return False
+            if not check(actual_value):
+                comparison = "" if is_flag else ">= "
+                logger.warning(f"Criterion failed: {criterion} = {actual_value}, expected {comparison}{expected_value}")
+                return False
         
         return True
 
@@ -557,19 +742,25 @@ class SacredDeploymentOrchestrator:
         """Generate recommendations for failed phase"""
         recommendations = []
         
-        for criterion, expected_value in phase.success_criteria.items():
+        for criterion, expected_value, check, is_flag in phase.criteria_validators():
             if criterion in metrics:
                 actual_value = metrics[criterion]
-                if isinstance(expected_value, (int, float)) and actual_value < expected_value:
-                    recommendations.append(f"Improve {criterion}: current {actual_value}, target {expected_value}")
-                elif isinstance(expected_value, bool) and actual_value != expected_value:
+                if check(actual_value):
+                    continue
+                if is_flag:
                     recommendations.append(f"Fix {criterion}: currently {actual_value}, should be {expected_value}")
+                else:
+                    recommendations.append(f"Improve {criterion}: current {actual_value}, target {expected_value}")
         
         return recommendations
 
+    def _completed_results(self) -> List[DeploymentResult]:
+        """Results of phases that have run, in phase order"""
+        return [result for result in self.phase_results if result is not None]
+
     def _generate_final_status(self) -> Dict[str, Any]:
         """Generate final deployment status"""
-        successful_phases = sum(1 for result in self.phase_results if result.success)
+        successful_phases = sum(1 for result in self._completed_results() if result.success)
         total_phases = len(self.deployment_phases)
         
         return {
@@ -584,13 +775,13 @@ class SacredDeploymentOrchestrator:
             'economics_validated': successful_phases >= 5
         }
 
-    def _export_deployment_manifest(self, deployment_summary: Dict[str, Any]):
+    async def _export_deployment_manifest(self, deployment_summary: Dict[str, Any]):
         """Export complete deployment manifest"""
         manifest_path = Path("deployment/sacred_deployment_manifest.json")
-        manifest_path.parent.mkdir(exist_ok=True)
         
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(deployment_summary, f, indent=2, ensure_ascii=False)
+        await asyncio.get_running_loop().run_in_executor(
+            None, _write_deployment_manifest, manifest_path, deployment_summary
+        )
         
         logger.info(f"Sacred deployment manifest exported to {manifest_path}")
 
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Enochian Cyphers Sacred Deployment Orchestrator Tests
+
+Verifies the phase scheduling of the sacred deployment:
+- Phases run in prerequisite order on every deployment
+- A failed phase stops every phase that depends on it
+- Repeat deployments on one orchestrator start from a clean slate
+- Phase success follows success criteria edited or removed after construction
+
+The deployment systems are replaced with stand-ins, so no live APIs,
+Bitcoin nodes or manifest files are touched.
+"""
+
+import asyncio
+import sys
+import unittest
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+from unittest import mock
+
+# Add deployment directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+# The orchestrator imports every deployment system at module load; the
+# scheduling tests never call into them
+for module_name in (
+    'lighthouse.live_api_integrator',
+    'onchain.tap_deployer',
+    'community.beta_feedback_collector',
+    'engines.optimized_quest_engine',
+    'economics.market_validator',
+):
+    sys.modules.setdefault(module_name, mock.MagicMock())
+
+from sacred_deployment_orchestrator import SacredDeploymentOrchestrator
+
+# Configure logging for tests
+logging.basicConfig(level=logging.CRITICAL, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+PHASE_METHODS = [
+    '_execute_live_deployment_phase',
+    '_execute_bitcoin_l1_phase',
+    '_execute_community_beta_phase',
+    '_execute_performance_optimization_phase',
+    '_execute_economic_validation_phase',
+]
+
+class TestSacredDeploymentScheduling(unittest.TestCase):
+    """Test phase ordering and failure gating across deployments"""
+
+    def setUp(self):
+        self.orchestrator = SacredDeploymentOrchestrator()
+        self.phase_events: List[Tuple[str, int]] = []
+        self.failing_phases = set()
+
+        for phase in self.orchestrator.deployment_phases:
+            setattr(self.orchestrator, PHASE_METHODS[phase.phase_number - 1], self._make_phase_stub(phase))
+
+        # Keep the manifest off disk
+        self.orchestrator._export_deployment_manifest = mock.AsyncMock()
+
+    def _make_phase_stub(self, phase):
+        """Phase stand-in that records its start and end and meets its criteria unless told to fail"""
+        async def run_phase() -> Dict[str, Any]:
+            self.phase_events.append(('start', phase.phase_number))
+            await asyncio.sleep(0)
+            self.phase_events.append(('end', phase.phase_number))
+            metrics = dict(phase.success_criteria)
+            if phase.phase_number in self.failing_phases:
+                first_criterion = next(iter(metrics))
+                metrics[first_criterion] = False
+            return metrics
+        return run_phase
+
+    def _deploy(self) -> Dict[str, Any]:
+        self.phase_events = []
+        return asyncio.run(self.orchestrator.execute_sacred_deployment())
+
+    def test_repeat_deployment_runs_phases_in_order(self):
+        """Test a second deployment re-gates every phase on its prerequisites"""
+        for _ in range(2):
+            result = self._deploy()
+            self.assertTrue(result['deployment_success'])
+            expected_events = [(event, number) for number in range(1, 6) for event in ('start', 'end')]
+            self.assertEqual(self.phase_events, expected_events)
+            self.assertEqual(self.orchestrator.current_phase, 5)
+            self.assertEqual(result['total_phases_completed'], 5)
+
+    def test_repeat_deployment_failure_gates_later_phases(self):
+        """Test a phase 1 failure on a second deployment stops phases 2-5"""
+        first_result = self._deploy()
+        self.assertTrue(first_result['deployment_success'])
+
+        self.failing_phases = {1}
+        second_result = self._deploy()
+        self.assertFalse(second_result['deployment_success'])
+        self.assertEqual(self.phase_events, [('start', 1), ('end', 1)])
+        self.assertEqual(second_result['total_phases_completed'], 1)
+        self.assertEqual(second_result['final_status']['phases_completed'], 0)
+        self.assertEqual(self.orchestrator.current_phase, 0)
+
+class TestPhaseSuccessCriteria(unittest.TestCase):
+    """Test phase evaluation follows the current success criteria"""
+
+    def setUp(self):
+        self.orchestrator = SacredDeploymentOrchestrator()
+        self.beta_phase = self.orchestrator.deployment_phases[2]
+        self.metrics = {
+            'beta_players_registered': 5,
+            'guild_circles_created': 2,
+            'feedback_system_operational': True,
+            'consensus_mechanisms_tested': True
+        }
+
+    def test_lowered_targets_apply_after_construction(self):
+        """Test edited numeric targets are used by evaluation and recommendations"""
+        self.assertFalse(self.orchestrator._evaluate_phase_success(self.beta_phase, self.metrics))
+
+        self.beta_phase.success_criteria['beta_players_registered'] = 5
+        self.beta_phase.success_criteria['guild_circles_created'] = 2
+        self.assertTrue(self.orchestrator._evaluate_phase_success(self.beta_phase, self.metrics))
+        self.assertEqual(self.orchestrator._generate_phase_recommendations(self.beta_phase, self.metrics), [])
+
+    def test_removed_criterion_is_no_longer_required(self):
+        """Test a criterion dropped after construction is not reported missing"""
+        del self.beta_phase.success_criteria['consensus_mechanisms_tested']
+        del self.metrics['consensus_mechanisms_tested']
+        self.beta_phase.success_criteria['beta_players_registered'] = 5
+        self.beta_phase.success_criteria['guild_circles_created'] = 2
+        self.assertTrue(self.orchestrator._evaluate_phase_success(self.beta_phase, self.metrics))
+
+def run_deployment_tests():
+    """Run the sacred deployment orchestrator tests"""
+    logger.info("Running Enochian Cyphers Sacred Deployment Orchestrator Tests")
+
+    test_suite = unittest.TestSuite()
+    for test_case in (TestSacredDeploymentScheduling, TestPhaseSuccessCriteria):
+        test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(test_case))
+    runner = unittest.TextTestRunner(verbosity=2)
+    return runner.run(test_suite)
+
+if __name__ == "__main__":
+    result = run_deployment_tests()
+    sys.exit(0 if result.wasSuccessful() else 1)
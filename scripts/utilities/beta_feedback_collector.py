@@ -20,20 +20,154 @@ Expert Blueprint Reference: "Community Beta Planning: Forging Player Alliances i
 import json
 import logging
 import time
+import functools
 import hashlib
+import operator
+import os
+import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime, timedelta
-from collections import defaultdict
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
+from collections import Counter
+
+try:
+    import orjson  # Optional accelerator; reports fall back to stdlib json
+except ImportError:
+    orjson = None
 
 # Configure logging with sacred community patterns
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - [COMMUNITY] - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Slotted records drop the per-instance __dict__ (dataclass slots need Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+def _fast_id(*parts: Any) -> str:
+    """Derive a 16-hex community id from its parts plus a nanosecond salt"""
+    seed = ":".join(map(str, parts)) + f":{time.time_ns()}"
+    return hashlib.blake2b(seed.encode(), digest_size=8).hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def _dataclass_reader(cls: type) -> Tuple[Tuple[str, ...], Any]:
+    """Field names and a tuple-returning attrgetter for a dataclass type, built once per type"""
+    names = tuple(f.name for f in fields(cls))
+    if len(names) == 1:
+        return names, lambda obj: (getattr(obj, names[0]),)
+    return names, operator.attrgetter(*names)
+
+def _shallow_dataclass_dict(obj: Any) -> Dict[str, Any]:
+    """json default hook: flatten a dataclass without asdict's recursive deep copy"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        names, read_fields = _dataclass_reader(type(obj))
+        return dict(zip(names, read_fields(obj)))
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _jsonl_line(record: Dict[str, Any]) -> bytes:
+    """Encode one compact JSON Lines record"""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, ensure_ascii=False, default=_shallow_dataclass_dict).encode('utf-8') + b"\n"
+
+# Mystical archetypes based on Tarot Major Arcana
+MYSTICAL_ARCHETYPES = (
+    "The Fool", "The Magician", "The High Priestess", "The Empress",
+    "The Emperor", "The Hierophant", "The Lovers", "The Chariot",
+    "Strength", "The Hermit", "Wheel of Fortune", "Justice",
+    "The Hanged Man", "Death", "Temperance", "The Devil",
+    "The Tower", "The Star", "The Moon", "The Sun",
+    "Judgement", "The World"
+)
+_N_ARCHETYPES = len(MYSTICAL_ARCHETYPES)
+
+# Cached ISO timestamps are reused for this long (50ms) before being refreshed
+TIMESTAMP_REFRESH_NS = 50_000_000
+
+
+# Keyword vocabularies for GitHub Discussions analysis
+GOVERNOR_NAMES = ('LEXARPH', 'COMANAN', 'TABITOM', 'VALGARS', 'ADOEOET')  # Sample governors
+AUTHENTICITY_KEYWORDS = (
+    'authentic', 'accurate', 'traditional', 'genuine', 'faithful',
+    'enochian', 'mystical', 'sacred', 'wisdom', 'ancient'
+)
+POSITIVE_WORDS = ('good', 'great', 'excellent', 'amazing', 'love', 'perfect', 'wonderful')
+NEGATIVE_WORDS = ('bad', 'terrible', 'awful', 'hate', 'wrong', 'poor', 'disappointing')
+
+# Discussion batches at least this large are analyzed across worker processes. A
+# discussion costs ~0.1ms to scan while a spawned pool costs ~150ms to start, so
+# the pool only pays off from a few thousand discussions on a multi-core host
+PARALLEL_DISCUSSION_THRESHOLD = 4096
+
+# Vocabularies are folded once at import and each text once per discussion; the
+# keyword probes are then C-level substring searches, which benchmark well ahead
+# of a combined regex alternation for this handful of short literals
+_GOVERNOR_SCAN_KEYS = tuple((governor.lower(), governor) for governor in GOVERNOR_NAMES)
+_KEYWORD_VOCABULARIES = (
+    ('authenticity', AUTHENTICITY_KEYWORDS),
+    ('positive', POSITIVE_WORDS),
+    ('negative', NEGATIVE_WORDS),
+)
+
+def _scan_keywords(text_lower: str) -> Dict[str, set]:
+    """Collect the distinct keywords found in folded text, grouped by vocabulary"""
+    return {
+        category: {keyword for keyword in keywords if keyword in text_lower}
+        for category, keywords in _KEYWORD_VOCABULARIES
+    }
+
+def _extract_governor_mentions(body_lower: str, title_lower: str) -> List[str]:
+    """Extract governor mentions from folded discussion text"""
+    return [governor for key, governor in _GOVERNOR_SCAN_KEYS if key in body_lower or key in title_lower]
+
+def _extract_authenticity_indicators(hits: Dict[str, set]) -> Dict[str, Any]:
+    """Extract authenticity indicators from scanned keywords"""
+    keyword_matches = len(hits['authenticity'])
+    
+    # Simple scoring based on keyword density
+    score = min(keyword_matches / len(AUTHENTICITY_KEYWORDS), 1.0)
+    
+    return {
+        'score': score,
+        'keywords_found': keyword_matches,
+        'total_keywords': len(AUTHENTICITY_KEYWORDS)
+    }
+
+def _analyze_sentiment(hits: Dict[str, set]) -> str:
+    """Simple sentiment analysis for community feedback"""
+    positive_count = len(hits['positive'])
+    negative_count = len(hits['negative'])
+    
+    if positive_count > negative_count:
+        return 'positive'
+    elif negative_count > positive_count:
+        return 'negative'
+    else:
+        return 'neutral'
+
+def _process_one_discussion(discussion: Dict[str, Any], processed_timestamp: str) -> Dict[str, Any]:
+    """Analyze a single GitHub discussion (module-level so worker processes can run it)"""
+    # Extract relevant feedback from discussion
+    title = discussion.get('title', '')
+    body = discussion.get('body', '')
+    comments = discussion.get('comments', [])
+    
+    # Analyze for governor feedback; the title only contributes governor mentions
+    body_lower = body.lower()
+    body_hits = _scan_keywords(body_lower)
+    governor_mentions = _extract_governor_mentions(body_lower, title.lower())
+    authenticity_indicators = _extract_authenticity_indicators(body_hits)
+    
+    return {
+        'discussion_id': discussion.get('id', ''),
+        'title': title,
+        'governor_mentions': governor_mentions,
+        'authenticity_score': authenticity_indicators.get('score', 0.0),
+        'community_sentiment': _analyze_sentiment(body_hits),
+        'comment_count': len(comments),
+        'processed_timestamp': processed_timestamp
+    }
+
+@dataclass(**_DATACLASS_SLOTS)
 class BetaPlayer:
     """Beta player profile with mystical archetype"""
     player_id: str
@@ -47,7 +181,7 @@ class BetaPlayer:
     preferred_traditions: List[str]
     beta_access_level: str  # "initiate", "adept", "master"
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FeedbackSubmission:
     """Community feedback submission with authenticity scoring"""
     submission_id: str
@@ -63,7 +197,7 @@ class FeedbackSubmission:
     submission_timestamp: str
     verified: bool
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class GuildCircle:
     """P2P guild circle for communal wisdom sharing"""
     guild_id: str
@@ -76,7 +210,7 @@ class GuildCircle:
     active_discussions: List[str]
     guild_hypertoken_pool: int
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EconomicAdjustment:
     """Dynamic economic adjustment based on community feedback"""
     adjustment_id: str
@@ -112,20 +246,16 @@ class CommunityBetaFramework:
         }
         
         # Mystical archetypes based on Tarot Major Arcana
-        self.mystical_archetypes = [
-            "The Fool", "The Magician", "The High Priestess", "The Empress",
-            "The Emperor", "The Hierophant", "The Lovers", "The Chariot",
-            "Strength", "The Hermit", "Wheel of Fortune", "Justice",
-            "The Hanged Man", "Death", "Temperance", "The Devil",
-            "The Tower", "The Star", "The Moon", "The Sun",
-            "Judgement", "The World"
-        ]
+        self.mystical_archetypes = MYSTICAL_ARCHETYPES
         
         # Community data storage
         self.beta_players: Dict[str, BetaPlayer] = {}
+        self._archetype_counts: List[int] = [0] * _N_ARCHETYPES  # Indexed like MYSTICAL_ARCHETYPES
+        self._quality_totals: Dict[str, Tuple[float, int]] = {}  # player_id -> (quality sum, submissions)
         self.feedback_submissions: Dict[str, FeedbackSubmission] = {}
         self.guild_circles: Dict[str, GuildCircle] = {}
         self.economic_adjustments: List[EconomicAdjustment] = []
+        self._timestamp_cache: Tuple[int, str] = (-1, '')
         
         # Statistics tracking
         self.community_stats = {
@@ -139,16 +269,25 @@ class CommunityBetaFramework:
         
         logger.info("Community Beta Framework initialized - Sacred circles ready for wisdom sharing")
 
+    def _now_iso(self) -> str:
+        """Current ISO timestamp, reformatted at most once per TIMESTAMP_REFRESH_NS"""
+        bucket = time.monotonic_ns() // TIMESTAMP_REFRESH_NS
+        if bucket != self._timestamp_cache[0]:
+            self._timestamp_cache = (bucket, datetime.now().isoformat())
+        return self._timestamp_cache[1]
+
     def register_beta_player(self, username: str, staked_tokens: int = 0) -> BetaPlayer:
         """
         Register new beta player with mystical archetype assignment
         Uses Tarot spreads for player archetype determination
         """
-        player_id = hashlib.sha256(f"{username}:{time.time()}".encode()).hexdigest()[:16]
+        player_id = _fast_id(username)
         
         # Assign mystical archetype based on username hash and sacred patterns
-        archetype_index = hash(username) % len(self.mystical_archetypes)
-        mystical_archetype = self.mystical_archetypes[archetype_index]
+        # (a digest rather than hash() so assignments survive process restarts)
+        username_digest = hashlib.blake2b(username.encode(), digest_size=8).digest()
+        archetype_index = int.from_bytes(username_digest, 'big') % _N_ARCHETYPES
+        mystical_archetype = MYSTICAL_ARCHETYPES[archetype_index]
         
         # Determine beta access level based on staked tokens
         if staked_tokens >= 1000:
@@ -161,7 +300,7 @@ class CommunityBetaFramework:
         player = BetaPlayer(
             player_id=player_id,
             username=username,
-            join_date=datetime.now().isoformat(),
+            join_date=self._now_iso(),
             mystical_archetype=mystical_archetype,
             staked_hypertokens=staked_tokens,
             authenticity_contributions=0.0,
@@ -172,6 +311,7 @@ class CommunityBetaFramework:
         )
         
         self.beta_players[player_id] = player
+        self._archetype_counts[archetype_index] += 1
         self.community_stats['total_players'] += 1
         
         logger.info(f"Registered beta player {username} as {mystical_archetype} ({access_level} level)")
@@ -183,13 +323,14 @@ class CommunityBetaFramework:
         Create new guild circle for communal wisdom sharing
         Implements Sufi circles and Celtic Druidic groves patterns
         """
-        guild_id = hashlib.sha256(f"{guild_name}:{tradition_focus}:{time.time()}".encode()).hexdigest()[:16]
+        guild_id = _fast_id(guild_name, tradition_focus)
         
         guild = GuildCircle(
             guild_id=guild_id,
             guild_name=guild_name,
-            tradition_focus=tradition_focus,
-            circle_type=circle_type,
+            # Low-cardinality labels are interned so guilds share one string object
+            tradition_focus=sys.intern(tradition_focus),
+            circle_type=sys.intern(circle_type),
             members=[founder_id],
             collective_wisdom_score=0.0,
             consensus_threshold=self.community_constants['consensus_threshold'],
@@ -215,7 +356,32 @@ class CommunityBetaFramework:
         Submit community feedback with authenticity validation
         Integrates with autonomous economic system for dynamic adjustments
         """
-        submission_id = hashlib.sha256(f"{player_id}:{quest_id}:{time.time()}".encode()).hexdigest()[:16]
+        submission = self._record_feedback(player_id, governor_name, quest_id,
+                                           authenticity_score, gameplay_rating,
+                                           wisdom_accuracy, tradition_authenticity,
+                                           improvements, insights)
+        
+        logger.info(f"Feedback submitted for {governor_name} quest {quest_id} by player {player_id}")
+        return submission
+
+    def submit_feedback_batch(self, records: Iterable[Dict[str, Any]]) -> List[FeedbackSubmission]:
+        """
+        Submit a burst of community feedback (e.g. an end-of-quest survey export)
+        Each record holds submit_feedback's keyword arguments; the batch shares
+        the same bookkeeping but is logged once instead of per submission
+        """
+        submissions = [self._record_feedback(**record) for record in records]
+        
+        governors = {submission.governor_name for submission in submissions}
+        logger.info(f"Feedback batch submitted: {len(submissions)} submissions covering {len(governors)} governors")
+        return submissions
+
+    def _record_feedback(self, player_id: str, governor_name: str, quest_id: str,
+                         authenticity_score: float, gameplay_rating: float,
+                         wisdom_accuracy: float, tradition_authenticity: float,
+                         improvements: str, insights: str) -> FeedbackSubmission:
+        """Store a feedback submission and apply its player and economic effects"""
+        submission_id = _fast_id(player_id, quest_id)
         
         submission = FeedbackSubmission(
             submission_id=submission_id,
@@ -228,7 +394,7 @@ class CommunityBetaFramework:
             tradition_authenticity=tradition_authenticity,
             suggested_improvements=improvements,
             mystical_insights=insights,
-            submission_timestamp=datetime.now().isoformat(),
+            submission_timestamp=self._now_iso(),
             verified=False
         )
         
@@ -239,12 +405,15 @@ class CommunityBetaFramework:
         if player_id in self.beta_players:
             player = self.beta_players[player_id]
             player.authenticity_contributions += authenticity_score
-            player.feedback_quality_score = self._calculate_feedback_quality(player_id)
+            quality_sum, submission_count = self._quality_totals.get(player_id, (0.0, 0))
+            quality_sum += self._score_feedback_quality(submission)
+            submission_count += 1
+            self._quality_totals[player_id] = (quality_sum, submission_count)
+            player.feedback_quality_score = quality_sum / submission_count
         
         # Check if economic adjustment is needed
         self._evaluate_economic_adjustment(submission)
         
-        logger.info(f"Feedback submitted for {governor_name} quest {quest_id} by player {player_id}")
         return submission
 
     def collect_guild_consensus(self, guild_id: str, topic: str, 
@@ -260,7 +429,43 @@ class CommunityBetaFramework:
         
         # Calculate consensus
         total_votes = len(member_votes)
-        positive_votes = sum(1 for vote in member_votes.values() if vote)
+        positive_votes = sum(map(bool, member_votes.values()))
+        
+        consensus_result = self._build_consensus_result(guild, topic, total_votes, positive_votes)
+        
+        logger.info(f"Guild {guild.guild_name} consensus on '{topic}': {consensus_result['consensus_ratio']:.1%} ({'✅ Achieved' if consensus_result['consensus_achieved'] else '❌ Failed'})")
+        return consensus_result
+
+    def collect_guild_consensus_batch(self, guild_id: str, topics: List[str],
+                                      vote_masks: List[int], total_votes: int) -> Dict[str, Any]:
+        """
+        Collect guild consensus on many topics at once
+        Each topic's votes are bit-packed into an int (bit i set = member i approves)
+        so a tally is a single popcount instead of a walk over a vote dict
+        """
+        if guild_id not in self.guild_circles:
+            return {'success': False, 'error': 'Guild not found'}
+        if len(topics) != len(vote_masks):
+            return {'success': False, 'error': 'Topic and vote mask counts differ'}
+        # A mask may only set bits for the total_votes members who voted
+        mask_limit = 1 << max(total_votes, 0)
+        if any(not 0 <= mask < mask_limit for mask in vote_masks):
+            return {'success': False, 'error': 'Vote mask has bits outside total_votes'}
+        
+        guild = self.guild_circles[guild_id]
+        
+        results = [
+            self._build_consensus_result(guild, topic, total_votes, bin(mask).count('1'))
+            for topic, mask in zip(topics, vote_masks)
+        ]
+        achieved = sum(1 for result in results if result['consensus_achieved'])
+        
+        logger.info(f"Guild {guild.guild_name} consensus on {len(results)} topics: {achieved} achieved")
+        return {'success': True, 'guild_id': guild_id, 'results': results}
+
+    def _build_consensus_result(self, guild: GuildCircle, topic: str,
+                                total_votes: int, positive_votes: int) -> Dict[str, Any]:
+        """Build a consensus record and update consensus statistics"""
         consensus_ratio = positive_votes / total_votes if total_votes > 0 else 0
         
         consensus_achieved = consensus_ratio >= guild.consensus_threshold
@@ -268,79 +473,74 @@ class CommunityBetaFramework:
         if consensus_achieved:
             self.community_stats['consensus_achieved'] += 1
         
-        consensus_result = {
+        return {
             'success': True,
             'topic': topic,
-            'guild_id': guild_id,
+            'guild_id': guild.guild_id,
             'total_votes': total_votes,
             'positive_votes': positive_votes,
             'consensus_ratio': consensus_ratio,
             'consensus_achieved': consensus_achieved,
             'threshold': guild.consensus_threshold,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._now_iso()
         }
-        
-        logger.info(f"Guild {guild.guild_name} consensus on '{topic}': {consensus_ratio:.1%} ({'✅ Achieved' if consensus_achieved else '❌ Failed'})")
-        return consensus_result
 
     def integrate_github_discussions(self, discussion_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Integrate feedback from GitHub Discussions
         Processes community discussions for insights and feedback
         """
-        processed_discussions = []
-        
-        for discussion in discussion_data:
-            # Extract relevant feedback from discussion
-            title = discussion.get('title', '')
-            body = discussion.get('body', '')
-            comments = discussion.get('comments', [])
-            
-            # Analyze for governor feedback
-            governor_mentions = self._extract_governor_mentions(title + ' ' + body)
-            authenticity_indicators = self._extract_authenticity_indicators(body)
+        # One timestamp covers the whole batch
+        process_discussion = functools.partial(_process_one_discussion, processed_timestamp=self._now_iso())
+        
+        # Large scraped batches are CPU-bound keyword scans, so spread them over processes
+        if len(discussion_data) >= PARALLEL_DISCUSSION_THRESHOLD and (os.cpu_count() or 1) > 1:
+            # Pulls in multiprocessing; only needed here
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
             
-            processed_discussion = {
-                'discussion_id': discussion.get('id', ''),
-                'title': title,
-                'governor_mentions': governor_mentions,
-                'authenticity_score': authenticity_indicators.get('score', 0.0),
-                'community_sentiment': self._analyze_sentiment(body),
-                'comment_count': len(comments),
-                'processed_timestamp': datetime.now().isoformat()
-            }
-            
-            processed_discussions.append(processed_discussion)
+            # Spawned workers never inherit a caller's logging threads or their locks
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+                processed_discussions = list(executor.map(process_discussion, discussion_data, chunksize=64))
+        else:
+            processed_discussions = [process_discussion(discussion) for discussion in discussion_data]
+        
+        # Aggregate in a single pass over the processed discussions
+        governor_feedback = 0
+        authenticity_sum = 0.0
+        for processed in processed_discussions:
+            if processed['governor_mentions']:
+                governor_feedback += 1
+            authenticity_sum += processed['authenticity_score']
         
         integration_result = {
             'total_discussions': len(discussion_data),
             'processed_discussions': processed_discussions,
-            'governor_feedback_extracted': len([d for d in processed_discussions if d['governor_mentions']]),
-            'average_authenticity': sum(d['authenticity_score'] for d in processed_discussions) / len(processed_discussions) if processed_discussions else 0.0
+            'governor_feedback_extracted': governor_feedback,
+            'average_authenticity': authenticity_sum / len(processed_discussions) if processed_discussions else 0.0
         }
         
         logger.info(f"Integrated {len(discussion_data)} GitHub discussions with {integration_result['governor_feedback_extracted']} governor feedback items")
         return integration_result
 
-    def _calculate_feedback_quality(self, player_id: str) -> float:
-        """Calculate player's feedback quality score"""
-        player_submissions = [sub for sub in self.feedback_submissions.values() if sub.player_id == player_id]
-        
-        if not player_submissions:
-            return 0.0
-        
+    def integrate_github_discussions_stream(self, discussions: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily integrate GitHub Discussions one at a time
+        Accepts any iterable (e.g. ijson.items(fp, 'item') or a JSON Lines reader)
+        so memory stays bounded by a single discussion regardless of export size
+        """
+        for discussion in discussions:
+            yield _process_one_discussion(discussion, self._now_iso())
+
+    def _score_feedback_quality(self, submission: FeedbackSubmission) -> float:
+        """Calculate the quality score of a single feedback submission"""
         # Weight different aspects of feedback quality
-        total_score = 0.0
-        for submission in player_submissions:
-            quality_score = (
-                submission.authenticity_score * 0.4 +
-                submission.wisdom_accuracy * 0.3 +
-                submission.tradition_authenticity * 0.2 +
-                (1.0 if submission.suggested_improvements else 0.0) * 0.1
-            )
-            total_score += quality_score
-        
-        return total_score / len(player_submissions)
+        return (
+            submission.authenticity_score * 0.4 +
+            submission.wisdom_accuracy * 0.3 +
+            submission.tradition_authenticity * 0.2 +
+            (1.0 if submission.suggested_improvements else 0.0) * 0.1
+        )
 
     def _evaluate_economic_adjustment(self, submission: FeedbackSubmission):
         """Evaluate if economic adjustment is needed based on feedback"""
@@ -350,12 +550,12 @@ class CommunityBetaFramework:
         
         if authenticity_deviation > 0.1:  # 10% deviation threshold
             adjustment = EconomicAdjustment(
-                adjustment_id=hashlib.sha256(f"{submission.submission_id}:adjustment".encode()).hexdigest()[:16],
+                adjustment_id=hashlib.blake2b(f"{submission.submission_id}:adjustment".encode(), digest_size=8).hexdigest(),
                 trigger_feedback=submission.submission_id,
                 governor_affected=submission.governor_name,
                 price_multiplier=1.0 + (authenticity_deviation * 0.5),  # Adjust price based on deviation
                 authenticity_threshold=submission.authenticity_score,
-                implementation_timestamp=datetime.now().isoformat(),
+                implementation_timestamp=self._now_iso(),
                 community_consensus=0.0,  # To be calculated
                 rollback_conditions={'min_consensus': 0.67, 'time_limit_hours': 24}
             )
@@ -365,87 +565,72 @@ class CommunityBetaFramework:
             
             logger.info(f"Economic adjustment triggered for {submission.governor_name} due to authenticity deviation: {authenticity_deviation:.2f}")
 
-    def _extract_governor_mentions(self, text: str) -> List[str]:
-        """Extract governor mentions from text"""
-        # Sample governor names for detection
-        governor_names = ['LEXARPH', 'COMANAN', 'TABITOM', 'VALGARS', 'ADOEOET']
-        mentions = []
-        
-        text_upper = text.upper()
-        for governor in governor_names:
-            if governor in text_upper:
-                mentions.append(governor)
-        
-        return mentions
-
-    def _extract_authenticity_indicators(self, text: str) -> Dict[str, Any]:
-        """Extract authenticity indicators from text"""
-        authenticity_keywords = [
-            'authentic', 'accurate', 'traditional', 'genuine', 'faithful',
-            'enochian', 'mystical', 'sacred', 'wisdom', 'ancient'
-        ]
-        
-        text_lower = text.lower()
-        keyword_matches = sum(1 for keyword in authenticity_keywords if keyword in text_lower)
-        
-        # Simple scoring based on keyword density
-        score = min(keyword_matches / len(authenticity_keywords), 1.0)
-        
-        return {
-            'score': score,
-            'keywords_found': keyword_matches,
-            'total_keywords': len(authenticity_keywords)
-        }
-
-    def _analyze_sentiment(self, text: str) -> str:
-        """Simple sentiment analysis for community feedback"""
-        positive_words = ['good', 'great', 'excellent', 'amazing', 'love', 'perfect', 'wonderful']
-        negative_words = ['bad', 'terrible', 'awful', 'hate', 'wrong', 'poor', 'disappointing']
-        
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
-        
-        if positive_count > negative_count:
-            return 'positive'
-        elif negative_count > positive_count:
-            return 'negative'
-        else:
-            return 'neutral'
-
     def export_community_report(self, filename: str):
         """Export comprehensive community beta report"""
         report = {
             'community_beta_report_version': '1.0',
-            'generation_timestamp': datetime.now().isoformat(),
+            'generation_timestamp': self._now_iso(),
             'community_constants': self.community_constants,
             'community_statistics': self.community_stats,
-            'beta_players': {pid: asdict(player) for pid, player in self.beta_players.items()},
-            'guild_circles': {gid: asdict(guild) for gid, guild in self.guild_circles.items()},
-            'feedback_submissions': {sid: asdict(sub) for sid, sub in self.feedback_submissions.items()},
-            'economic_adjustments': [asdict(adj) for adj in self.economic_adjustments],
+            'beta_players': self.beta_players,
+            'guild_circles': self.guild_circles,
+            'feedback_submissions': self.feedback_submissions,
+            'economic_adjustments': self.economic_adjustments,
             'mystical_archetypes_distribution': self._calculate_archetype_distribution(),
             'guild_tradition_focus_distribution': self._calculate_tradition_distribution()
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        # Dataclasses are serialized in place rather than copied through asdict
+        if orjson is not None:
+            Path(filename).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False, default=_shallow_dataclass_dict)
         
         logger.info(f"Community beta report exported to {filename}")
 
+    def export_community_report_jsonl(self, filename: str):
+        """
+        Export community beta report as JSON Lines
+        Writes a header record followed by one record per player, guild,
+        submission and adjustment so memory stays bounded by a single record
+        """
+        header = {
+            'kind': 'header',
+            'community_beta_report_version': '1.0',
+            'generation_timestamp': self._now_iso(),
+            'community_constants': self.community_constants,
+            'community_statistics': self.community_stats,
+            'mystical_archetypes_distribution': self._calculate_archetype_distribution(),
+            'guild_tradition_focus_distribution': self._calculate_tradition_distribution()
+        }
+        sections = (
+            ('player', self.beta_players.values()),
+            ('guild', self.guild_circles.values()),
+            ('feedback', self.feedback_submissions.values()),
+            ('economic_adjustment', self.economic_adjustments)
+        )
+        
+        with open(filename, 'wb') as f:
+            f.write(_jsonl_line(header))
+            for kind, records in sections:
+                for record in records:
+                    f.write(_jsonl_line({'kind': kind, **_shallow_dataclass_dict(record)}))
+        
+        logger.info(f"Community beta report streamed to {filename}")
+
     def _calculate_archetype_distribution(self) -> Dict[str, int]:
         """Calculate distribution of mystical archetypes among players"""
-        distribution = defaultdict(int)
-        for player in self.beta_players.values():
-            distribution[player.mystical_archetype] += 1
-        return dict(distribution)
+        # Counts are maintained at registration, so this is O(archetypes) not O(players)
+        return {
+            archetype: count
+            for archetype, count in zip(MYSTICAL_ARCHETYPES, self._archetype_counts)
+            if count
+        }
 
     def _calculate_tradition_distribution(self) -> Dict[str, int]:
         """Calculate distribution of tradition focus among guilds"""
-        distribution = defaultdict(int)
-        for guild in self.guild_circles.values():
-            distribution[guild.tradition_focus] += 1
-        return dict(distribution)
+        return Counter(guild.tradition_focus for guild in self.guild_circles.values())
 
 # Sacred invocation for community beta activation
 async def invoke_community_beta():